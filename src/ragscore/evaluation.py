@@ -25,6 +25,47 @@ _DETAILED_METRICS = [
 ]
 
 
+def _detailed_metric_averages(results: list) -> list[tuple[str, float]]:
+    """Average each detailed metric over results in one pass.
+
+    Returns (metric, average) pairs for metrics that have at least one
+    value, scanning the result list once instead of once per metric.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None:
+        matrix = np.array(
+            [
+                [
+                    getattr(r, m) if getattr(r, m, None) is not None else np.nan
+                    for m in _DETAILED_METRICS
+                ]
+                for r in results
+            ],
+            dtype=np.float64,
+        )
+        valid = ~np.isnan(matrix)
+        counts = valid.sum(axis=0)
+        sums = np.where(valid, matrix, 0.0).sum(axis=0)
+        avgs = np.divide(sums, counts, out=np.zeros(len(_DETAILED_METRICS)), where=counts > 0)
+        return [
+            (m, avg) for m, avg, count in zip(_DETAILED_METRICS, avgs.tolist(), counts) if count
+        ]
+
+    sums = [0.0] * len(_DETAILED_METRICS)
+    counts = [0] * len(_DETAILED_METRICS)
+    for r in results:
+        for i, m in enumerate(_DETAILED_METRICS):
+            val = getattr(r, m, None)
+            if val is not None:
+                sums[i] += val
+                counts[i] += 1
+    return [(m, s / c) for m, s, c in zip(_DETAILED_METRICS, sums, counts) if c]
+
+
 @dataclass
 class EvaluationResult:
     """Result of evaluating a single QA pair."""
@@ -619,11 +660,16 @@ async def evaluate_rag(
         async_pbar = get_async_pbar()
         results: list[EvaluationResult] = await async_pbar.gather(*tasks, desc="Evaluating")
 
-    # Calculate summary
+    # Calculate summary in a single scan of the results
     total = len(results)
-    correct = sum(1 for r in results if r.is_correct)
+    correct = 0
+    score_sum = 0.0
+    for r in results:
+        if r.is_correct:
+            correct += 1
+        score_sum += r.score
     incorrect = total - correct
-    avg_score = sum(r.score for r in results) / total if total > 0 else 0.0
+    avg_score = score_sum / total if total > 0 else 0.0
     accuracy = correct / total if total > 0 else 0.0
 
     return EvaluationSummary(
@@ -760,14 +806,9 @@ def run_evaluation(
     if detailed and summary.results:
         separator = "\u2500" * 60
         print(separator)
-        for metric in _DETAILED_METRICS:
-            vals = [
-                getattr(r, metric) for r in summary.results if getattr(r, metric, None) is not None
-            ]
-            if vals:
-                avg = sum(vals) / len(vals)
-                label = metric.replace("_", " ").title()
-                print(f"  {label}: {avg:.2f}/5.0")
+        for metric, avg in _detailed_metric_averages(summary.results):
+            label = metric.replace("_", " ").title()
+            print(f"  {label}: {avg:.2f}/5.0")
 
     if diagnose and summary.results:
         separator = "\u2500" * 60
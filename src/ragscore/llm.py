@@ -3,6 +3,8 @@ import re
 import uuid
 from typing import Any
 
+from . import llm_cache
+
 
 def safe_json_parse(raw: str) -> dict[str, Any]:
     """Safely parses a JSON string, cleaning and attempting to fix common errors."""
@@ -126,6 +128,36 @@ def detect_language(text: str) -> str:
     return "en"
 
 
+# Static QA-generation system prompts, built once instead of per chunk.
+_QA_SYSTEM_PROMPTS = {
+    "zh": (
+        "你是一个细心的数据集生成器。"
+        "生成的问题必须严格基于提供的上下文来回答。"
+        "关注核心概念、事实和技术细节。"
+        "返回一个包含'items'数组的JSON对象。"
+    ),
+    "ja": (
+        "あなたは正確なデータセット生成器です。"
+        "質問は提供されたコンテキストに基づいて厳密に回答可能でなければなりません。"
+        "核心的な概念、事実、技術的詳細に焦点を当ててください。"
+        "'items'配列を含むJSONオブジェクトを返してください。"
+    ),
+    "de": (
+        "Sie sind ein sorgfältiger Datensatz-Generator. "
+        "Generieren Sie Fragen, die ausschließlich aus dem bereitgestellten Kontext beantwortbar sind. "
+        "Konzentrieren Sie sich auf wesentliche Konzepte, Fakten und technische Details. "
+        "Geben Sie ein JSON-Objekt mit einem 'items'-Array zurück."
+    ),
+    "en": (
+        "You are a careful dataset generator. "
+        "Generate questions strictly answerable from the provided context. "
+        "Focus on substantive concepts, facts, and technical details. "
+        "Generate questions and answers in the SAME language as the context. "
+        "Return a JSON object with an 'items' array."
+    ),
+}
+
+
 def _build_qa_prompts(
     chunk_text: str,
     difficulty: str,
@@ -144,6 +176,8 @@ def _build_qa_prompts(
         audience: Target audience (e.g. 'internal staff', 'customers', 'developers').
         purpose: Document purpose (e.g. 'training', 'compliance', 'product FAQ').
     """
+    system_prompt = _QA_SYSTEM_PROMPTS.get(lang, _QA_SYSTEM_PROMPTS["en"])
+
     if lang == "zh":
         difficulty_map = {"easy": "简单", "medium": "中等", "hard": "困难"}
         diff_zh = difficulty_map.get(difficulty, difficulty)
@@ -161,13 +195,6 @@ def _build_qa_prompts(
                     f"- 文档用途：{purpose}。生成的问题应围绕该用途的核心关注点。\n"
                 )
 
-        system_prompt = (
-            "你是一个细心的数据集生成器。"
-            "生成的问题必须严格基于提供的上下文来回答。"
-            "关注核心概念、事实和技术细节。"
-            "返回一个包含'items'数组的JSON对象。"
-        )
-
         user_prompt = f"""
 上下文：
 \"\"\"{chunk_text}\"\"\"
@@ -197,13 +224,6 @@ def _build_qa_prompts(
                     f"- 文書の目的：{purpose}。この目的に関連する質問を重点的に生成してください。\n"
                 )
 
-        system_prompt = (
-            "あなたは正確なデータセット生成器です。"
-            "質問は提供されたコンテキストに基づいて厳密に回答可能でなければなりません。"
-            "核心的な概念、事実、技術的詳細に焦点を当ててください。"
-            "'items'配列を含むJSONオブジェクトを返してください。"
-        )
-
         user_prompt = f"""
 コンテキスト：
 \"\"\"{chunk_text}\"\"\"
@@ -229,13 +249,6 @@ def _build_qa_prompts(
             if purpose:
                 intent_instructions_de += f"- Dokumentzweck: {purpose}. Konzentrieren Sie die Fragen auf das, was für diesen Zweck wichtig ist.\n"
 
-        system_prompt = (
-            "Sie sind ein sorgfältiger Datensatz-Generator. "
-            "Generieren Sie Fragen, die ausschließlich aus dem bereitgestellten Kontext beantwortbar sind. "
-            "Konzentrieren Sie sich auf wesentliche Konzepte, Fakten und technische Details. "
-            "Geben Sie ein JSON-Objekt mit einem 'items'-Array zurück."
-        )
-
         user_prompt = f"""
 Kontext:
 \"\"\"{chunk_text}\"\"\"
@@ -259,14 +272,6 @@ Aufgabe:
             if purpose:
                 intent_instructions_en += f"- Document purpose: {purpose}. Focus questions on what matters for this purpose.\n"
 
-        system_prompt = (
-            "You are a careful dataset generator. "
-            "Generate questions strictly answerable from the provided context. "
-            "Focus on substantive concepts, facts, and technical details. "
-            "Generate questions and answers in the SAME language as the context. "
-            "Return a JSON object with an 'items' array."
-        )
-
         user_prompt = f"""
 Context:
 \"\"\"{chunk_text}\"\"\"
@@ -314,6 +319,13 @@ def generate_qa_for_chunk(
 
         provider = get_provider(model=model)
 
+    # Unchanged chunks with the same settings are served from the on-disk
+    # cache instead of a fresh API call (fresh ids keep QAs distinguishable)
+    cache_key = llm_cache.qa_key(chunk_text, difficulty, n, provider.model, audience, purpose)
+    cached = llm_cache.lookup(cache_key)
+    if cached is not None:
+        return [{**item, "id": str(uuid.uuid4())} for item in cached]
+
     # Detect language and build prompts
     lang = detect_language(chunk_text)
     system_prompt, user_prompt = _build_qa_prompts(
@@ -354,6 +366,9 @@ def generate_qa_for_chunk(
                 }
             )
 
+    if processed_qas:
+        llm_cache.store(cache_key, processed_qas)
+
     return processed_qas
 
 
@@ -387,6 +402,12 @@ async def agenerate_qa_for_chunk(
 
         provider = get_provider(model=model)
 
+    # Same on-disk cache as the sync path
+    cache_key = llm_cache.qa_key(chunk_text, difficulty, n, provider.model, audience, purpose)
+    cached = llm_cache.lookup(cache_key)
+    if cached is not None:
+        return [{**item, "id": str(uuid.uuid4())} for item in cached]
+
     # Detect language and build prompts
     lang = detect_language(chunk_text)
     system_prompt, user_prompt = _build_qa_prompts(
@@ -427,4 +448,54 @@ async def agenerate_qa_for_chunk(
                 }
             )
 
+    if processed_qas:
+        llm_cache.store(cache_key, processed_qas)
+
     return processed_qas
+
+
+async def agenerate_qa_batch(
+    chunk_texts: list[str],
+    difficulties: list[str],
+    n: int = 2,
+    provider=None,
+    model: str = None,
+    audience: str = None,
+    purpose: str = None,
+) -> list[list[dict[str, Any]]]:
+    """
+    Generate QA pairs for several chunks concurrently in one batch.
+
+    The chunks share one provider (and therefore one HTTP connection pool),
+    so total latency is one round-trip per batch instead of one per chunk.
+
+    Args:
+        chunk_texts: Texts to generate QA pairs from
+        difficulties: Question difficulty per chunk (same length as chunk_texts)
+        n: Number of QA pairs per chunk
+        provider: LLM provider instance (auto-detected if None)
+        model: Model name (uses provider default if None)
+        audience: Target audience (e.g. 'developers', 'customers')
+        purpose: Document purpose (e.g. 'training', 'faq', 'compliance')
+
+    Returns:
+        One list of QA pair dictionaries per chunk, in input order.
+        Chunks that fail yield an empty list.
+    """
+    import asyncio
+
+    if provider is None:
+        from .providers import get_provider
+
+        provider = get_provider(model=model)
+
+    results = await asyncio.gather(
+        *[
+            agenerate_qa_for_chunk(
+                text, difficulty, n=n, provider=provider, audience=audience, purpose=purpose
+            )
+            for text, difficulty in zip(chunk_texts, difficulties)
+        ],
+        return_exceptions=True,
+    )
+    return [r if isinstance(r, list) else [] for r in results]
@@ -0,0 +1,88 @@
+"""
+RAGScore QA Generation Cache
+
+On-disk cache for generated QA pairs, keyed by a hash of the chunk text and
+generation settings. Re-running generation over unchanged documents (the
+common case while iterating on a corpus) becomes a sqlite read instead of an
+LLM API call.
+
+The cache lives in ~/.ragscore/qa_cache.db and is enabled by default; set
+the RAGSCORE_NO_CACHE environment variable to disable it.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+_CACHE_PATH = Path.home() / ".ragscore" / "qa_cache.db"
+
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.Lock()
+
+
+def cache_enabled() -> bool:
+    """QA caching is on unless RAGSCORE_NO_CACHE is set."""
+    return not os.getenv("RAGSCORE_NO_CACHE")
+
+
+def _get_conn() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # generate_qa_for_chunk may run from executor threads, so the shared
+        # connection is guarded by _lock at every use
+        conn = sqlite3.connect(str(_CACHE_PATH), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS qa_cache (hash TEXT PRIMARY KEY, payload BLOB)")
+        _conn = conn
+    return _conn
+
+
+def qa_key(
+    chunk_text: str,
+    difficulty: str,
+    n: int,
+    model: str,
+    audience: Optional[str] = None,
+    purpose: Optional[str] = None,
+) -> str:
+    """Content hash identifying one generation request."""
+    raw = f"{difficulty}|{n}|{model}|{audience}|{purpose}|{chunk_text}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def lookup(key: str) -> Optional[list[dict[str, Any]]]:
+    """Return the cached QA items for key, or None on miss (or cache error)."""
+    if not cache_enabled():
+        return None
+    try:
+        with _lock:
+            row = (
+                _get_conn()
+                .execute("SELECT payload FROM qa_cache WHERE hash = ?", (key,))
+                .fetchone()
+            )
+        return json.loads(row[0]) if row else None
+    except (sqlite3.Error, OSError, ValueError):
+        return None
+
+
+def store(key: str, items: list[dict[str, Any]]) -> None:
+    """Persist QA items for key. Cache failures are silently ignored."""
+    if not cache_enabled():
+        return
+    try:
+        payload = json.dumps(items, ensure_ascii=False)
+        with _lock:
+            conn = _get_conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO qa_cache (hash, payload) VALUES (?, ?)", (key, payload)
+            )
+            conn.commit()
+    except (sqlite3.Error, OSError, TypeError, ValueError):
+        pass
@@ -21,6 +21,7 @@ Configuration (claude_desktop_config.json):
     }
 """
 
+import asyncio
 import json
 import platform
 import sys
@@ -37,6 +38,52 @@ except ImportError:
     FastMCP = None
 
 
+_DETAILED_METRICS = [
+    "correctness",
+    "completeness",
+    "relevance",
+    "conciseness",
+    "faithfulness",
+]
+
+
+def _format_metric_averages(rows: list) -> str:
+    """Format per-metric average lines from rows of values aligned with _DETAILED_METRICS.
+
+    Each row is a tuple of 5 scores (None where a metric is missing). Uses a
+    single NumPy nan-aware pass instead of one Python scan per metric; falls
+    back to a plain single-pass loop when NumPy is not installed.
+    """
+    if not rows:
+        return ""
+
+    try:
+        import numpy as np
+
+        arr = np.array(
+            [[np.nan if v is None else v for v in row] for row in rows], dtype=np.float64
+        )
+        counts = (~np.isnan(arr)).sum(axis=0)
+        sums = np.nansum(arr, axis=0)
+        avgs = [s / c if c else None for s, c in zip(sums, counts)]
+    except ImportError:
+        sums = [0.0] * len(_DETAILED_METRICS)
+        counts = [0] * len(_DETAILED_METRICS)
+        for row in rows:
+            for i, v in enumerate(row):
+                if v is not None:
+                    sums[i] += v
+                    counts[i] += 1
+        avgs = [s / c if c else None for s, c in zip(sums, counts)]
+
+    lines = ""
+    for metric, avg in zip(_DETAILED_METRICS, avgs):
+        if avg is not None:
+            label = metric.replace("_", " ").title()
+            lines += f"- {label}: {avg:.1f}/5.0\n"
+    return lines
+
+
 def _mcp_resolve_provider(provider: Optional[str] = None) -> Optional[str]:
     """Resolve provider for MCP context: prefer anthropic since user is in Claude ecosystem."""
     if provider:
@@ -140,30 +187,36 @@ def create_mcp_server():
         old_stdout = sys.stdout
         sys.stdout = sys.stderr
 
-        try:
-            config.ensure_dirs()
-            initialize_nltk()
-
+        def _read_and_chunk() -> tuple:
+            """Blocking doc IO and sentence tokenization, run off the loop."""
             docs = _read_from_paths([path])
-            if not docs:
-                _track_mcp_event(
-                    "mcp_generate_qa", {"provider": provider or "auto", "success": False}
-                )
-                return "❌ No documents found."
-
-            all_chunks = []
+            chunks_out = []
             for doc in docs:
-                chunks = chunk_text(doc["text"])
-                for chunk_text_content in chunks:
+                for chunk_text_content in chunk_text(doc["text"]):
                     if is_chunk_long_enough(chunk_text_content):
-                        all_chunks.append(
+                        chunks_out.append(
                             {
                                 "doc_id": doc["doc_id"],
                                 "path": doc["path"],
                                 "text": chunk_text_content,
-                                "chunk_id": len(all_chunks),
+                                "chunk_id": len(chunks_out),
                             }
                         )
+            return docs, chunks_out
+
+        try:
+            config.ensure_dirs()
+            initialize_nltk()
+
+            # Reading PDFs and NLTK tokenization are blocking; keep them off
+            # the event loop so the MCP server stays responsive to other
+            # requests while a large corpus is being prepared
+            docs, all_chunks = await asyncio.to_thread(_read_and_chunk)
+            if not docs:
+                _track_mcp_event(
+                    "mcp_generate_qa", {"provider": provider or "auto", "success": False}
+                )
+                return "❌ No documents found."
 
             if not all_chunks:
                 _track_mcp_event(
@@ -174,11 +227,10 @@ def create_mcp_server():
             resolved_provider = _mcp_resolve_provider(provider)
             llm_provider = get_provider(provider=resolved_provider, model=model)
             provider_info = _detect_provider_info(provider=resolved_provider, model=model)
-            if llm_provider.provider_name == "ollama" and concurrency > 2:
-                concurrency = 2
 
-            all_qas = await _async_generate_qas(
+            qa_count = await _async_generate_qas(
                 all_chunks,
+                config.GENERATED_QAS_PATH,
                 concurrency=concurrency,
                 provider=llm_provider,
                 num_questions=num_questions,
@@ -186,16 +238,13 @@ def create_mcp_server():
                 purpose=purpose,
             )
 
-            if not all_qas:
+            if not qa_count:
                 _track_mcp_event(
                     "mcp_generate_qa", {"provider": provider or "auto", "success": False}
                 )
                 return f"{provider_info}\n❌ No QA pairs were generated."
 
             output_file = str(config.GENERATED_QAS_PATH)
-            with open(output_file, "w", encoding="utf-8") as f:
-                for qa in all_qas:
-                    f.write(json.dumps(qa, ensure_ascii=False) + "\n")
 
             _track_mcp_event(
                 "mcp_generate_qa",
@@ -207,7 +256,7 @@ def create_mcp_server():
                     "success": True,
                 },
             )
-            return f"{provider_info}\n✅ Generated {len(all_qas)} QA pairs. Saved to: {output_file}"
+            return f"{provider_info}\n✅ Generated {qa_count} QA pairs. Saved to: {output_file}"
         except Exception as e:
             _track_mcp_event(
                 "mcp_generate_qa",
@@ -284,23 +333,12 @@ def create_mcp_server():
 
 """
             if detailed and summary.results:
-                metrics = [
-                    "correctness",
-                    "completeness",
-                    "relevance",
-                    "conciseness",
-                    "faithfulness",
-                ]
-                for metric in metrics:
-                    vals = [
-                        getattr(r, metric)
+                result += _format_metric_averages(
+                    [
+                        tuple(getattr(r, metric, None) for metric in _DETAILED_METRICS)
                         for r in summary.results
-                        if getattr(r, metric, None) is not None
                     ]
-                    if vals:
-                        avg = sum(vals) / len(vals)
-                        label = metric.replace("_", " ").title()
-                        result += f"- {label}: {avg:.1f}/5.0\n"
+                )
                 result += "\n"
 
             if diagnose and summary.results:
@@ -431,10 +469,12 @@ def create_mcp_server():
 
             # Save corrections so get_corrections() can retrieve them
             if result.corrections:
+                from .pipeline import _dumps_line
+
                 corrections_path = Path(config.OUTPUT_DIR) / "quick_test_corrections.jsonl"
-                with open(corrections_path, "w") as f:
+                with open(corrections_path, "wb") as f:
                     for c in result.corrections:
-                        f.write(json.dumps(c, ensure_ascii=False) + "\n")
+                        f.write(_dumps_line(c))
 
             status = "✅ PASSED" if result.passed else "❌ FAILED"
             output = f"""{provider_info}
@@ -448,19 +488,9 @@ def create_mcp_server():
 
 """
             if detailed and result.details:
-                metrics = [
-                    "correctness",
-                    "completeness",
-                    "relevance",
-                    "conciseness",
-                    "faithfulness",
-                ]
-                for metric in metrics:
-                    vals = [d.get(metric) for d in result.details if d.get(metric) is not None]
-                    if vals:
-                        avg = sum(vals) / len(vals)
-                        label = metric.replace("_", " ").title()
-                        output += f"- {label}: {avg:.1f}/5.0\n"
+                output += _format_metric_averages(
+                    [tuple(d.get(metric) for metric in _DETAILED_METRICS) for d in result.details]
+                )
                 output += "\n"
 
             if result.corrections:
@@ -513,42 +543,77 @@ def create_mcp_server():
         if not results_path.exists():
             return "No corrections available. Run quick_test_rag first."
 
-        corrections = []
-        with open(results_path) as f:
-            for line in f:
-                if line.strip():
-                    corrections.append(json.loads(line))
+        # Each line is already JSON; pass the raw text through instead of
+        # parsing and re-serializing every correction
+        with open(results_path, encoding="utf-8") as f:
+            lines = [line.strip() for line in f if line.strip()]
 
         if output_path:
             safe_path = _validate_output_path(output_path)
             safe_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(safe_path, "w") as f:
-                for c in corrections:
-                    f.write(json.dumps(c, ensure_ascii=False) + "\n")
-            return f"✅ Saved {len(corrections)} corrections to: {safe_path}"
+            safe_path.write_text("\n".join(lines) + "\n" if lines else "", encoding="utf-8")
+            return f"✅ Saved {len(lines)} corrections to: {safe_path}"
 
-        return json.dumps(corrections, indent=2, ensure_ascii=False)
+        return "[\n" + ",\n".join(lines) + "\n]" if lines else "[]"
+
+    # (mtime_ns, size)-keyed cache so polling clients don't re-read an
+    # unchanged results file — the stat pair acts as a weak ETag
+    _results_cache = {"etag": None, "payload": None}
 
     @mcp.resource("ragscore://latest_results")
     def get_latest_results() -> str:
         """Returns the full JSON content of the last evaluation run."""
+        import os
+
         from . import config
 
         results_path = Path(config.OUTPUT_DIR) / "results.json"
-        if results_path.exists():
-            return results_path.read_text()
-        return '{"error": "No results available. Run evaluate_rag first."}'
+        try:
+            st = os.stat(results_path)
+        except OSError:
+            return '{"error": "No results available. Run evaluate_rag first."}'
+
+        etag = (st.st_mtime_ns, st.st_size)
+        if etag == _results_cache["etag"]:
+            return _results_cache["payload"]
+
+        try:
+            payload = results_path.read_bytes().decode("utf-8")
+        except OSError:
+            return '{"error": "No results available. Run evaluate_rag first."}'
+
+        _results_cache["etag"] = etag
+        _results_cache["payload"] = payload
+        return payload
+
+    # Same stat-keyed scheme for the generated QA resource
+    _qas_cache = {"etag": None, "payload": None}
 
     @mcp.resource("ragscore://generated_qas")
     def get_generated_qas() -> str:
         """Returns the generated QA pairs from the last generation run."""
+        import itertools
+        import os
+
         from . import config
 
-        if config.GENERATED_QAS_PATH.exists():
-            lines = config.GENERATED_QAS_PATH.read_text().strip().split("\n")
-            qas = [json.loads(line) for line in lines if line.strip()]
-            return json.dumps(qas[:100], indent=2, ensure_ascii=False)  # Limit to 100
-        return '{"error": "No QA pairs available. Run generate_qa_dataset first."}'
+        try:
+            st = os.stat(config.GENERATED_QAS_PATH)
+        except OSError:
+            return '{"error": "No QA pairs available. Run generate_qa_dataset first."}'
+
+        etag = (st.st_mtime_ns, st.st_size)
+        if etag == _qas_cache["etag"]:
+            return _qas_cache["payload"]
+
+        # Only the first 100 records are served — never parse beyond them
+        with open(config.GENERATED_QAS_PATH, encoding="utf-8") as f:
+            qas = [json.loads(line) for line in itertools.islice(f, 100) if line.strip()]
+
+        payload = json.dumps(qas, indent=2, ensure_ascii=False)
+        _qas_cache["etag"] = etag
+        _qas_cache["payload"] = payload
+        return payload
 
     return mcp
 
@@ -6,7 +6,23 @@ from pathlib import Path
 from . import __version__, config
 from .data_processing import chunk_text, initialize_nltk, is_chunk_long_enough
 from .llm import agenerate_qa_for_chunk
-from .ui import get_async_pbar, get_pbar, patch_asyncio
+from .ui import get_pbar, patch_asyncio
+
+# orjson is optional; the JSONL writer falls back to stdlib json without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Chunks handled per scheduled task in _async_generate_qas
+_QA_BATCH_SIZE = 8
+
+
+def _dumps_line(obj: dict) -> bytes:
+    """Serialize one JSONL record (with trailing newline) to UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 def _read_from_paths(paths):
@@ -76,17 +92,22 @@ def _read_from_paths(paths):
 
 async def _async_generate_qas(
     chunks: list[dict],
+    save_path,
     concurrency: int = 5,
     provider=None,
     num_questions: int = None,
     audience: str = None,
     purpose: str = None,
-) -> list[dict]:
+) -> int:
     """
     Async QA generation with rate limiting via Semaphore.
 
+    QA pairs are appended to save_path as each batch completes, so memory
+    stays bounded and an interrupted run leaves a usable partial JSONL file.
+
     Args:
         chunks: List of chunk dictionaries
+        save_path: JSONL file to stream generated QA pairs into
         concurrency: Max concurrent LLM calls (default: 5)
         provider: LLM provider instance (auto-detected if None)
         num_questions: Number of QA pairs per chunk (default: config.NUM_Q_PER_CHUNK)
@@ -94,7 +115,7 @@ async def _async_generate_qas(
         purpose: Document purpose (e.g. 'training', 'faq', 'compliance')
 
     Returns:
-        List of generated QA pairs
+        Number of QA pairs written to save_path
     """
     n_per_chunk = num_questions or config.NUM_Q_PER_CHUNK
     if provider is None:
@@ -102,13 +123,19 @@ async def _async_generate_qas(
 
         provider = get_provider()
 
+    # Callers filter already, but guard at the boundary too: a too-short
+    # chunk must never cost a scheduled coroutine and an LLM call
+    chunks = [c for c in chunks if is_chunk_long_enough(c["text"])]
+
+    save_path = Path(save_path)
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+
     semaphore = asyncio.Semaphore(concurrency)
-    all_qas = []
+    qa_count = 0
     errors = []
 
-    async def process_chunk(chunk: dict) -> list[dict]:
+    async def process_chunk(chunk: dict, difficulty: str) -> list[dict]:
         """Process a single chunk with rate limiting and retry."""
-        difficulty = random.choice(config.DIFFICULTY_MIX)
         max_retries = 3
         retry_delay = 1.0
 
@@ -156,21 +183,62 @@ async def _async_generate_qas(
 
             return []
 
-    # Process all chunks with progress bar
-    tasks = [process_chunk(chunk) for chunk in chunks]
-
+    # Opened lazily on the first successful batch so a run that yields no
+    # QAs (provider down, every chunk erroring) never truncates an earlier
+    # output file.
+    out_file = None
+
+    async def process_batch(batch: list[tuple[dict, str]]) -> None:
+        """Process a group of (chunk, difficulty) pairs inside one task.
+
+        The chunks in a batch run concurrently — the semaphore alone caps
+        in-flight LLM calls, so parallelism stays min(N, concurrency).
+        Grouping only amortizes top-level task count and progress/IO work:
+        each batch flushes its results to disk in one write.
+        """
+        nonlocal qa_count, out_file
+        results = await asyncio.gather(
+            *(process_chunk(chunk, difficulty) for chunk, difficulty in batch)
+        )
+        lines = b"".join(_dumps_line(qa) for items in results for qa in items)
+        if lines:
+            if out_file is None:
+                out_file = open(save_path, "wb")
+            out_file.write(lines)
+            qa_count += sum(len(items) for items in results)
+
+    # One weighted draw up front instead of a random.choice call per chunk
+    difficulties = random.choices(config.DIFFICULTY_MIX, k=len(chunks))
+
+    # Process all chunks with progress bar, grouped into batch tasks
+    work = list(zip(chunks, difficulties))
+    tasks = [
+        process_batch(work[i : i + _QA_BATCH_SIZE]) for i in range(0, len(work), _QA_BATCH_SIZE)
+    ]
+
+    # as_completed instead of gather: the progress bar ticks the moment each
+    # batch lands rather than sitting silent until the slowest task returns.
+    # process_chunk already swallows failures into errors, so nothing raises.
+    pbar = get_pbar(total=len(tasks), desc="Generating QAs")
     try:
-        async_pbar = get_async_pbar()
-        results = await async_pbar.gather(*tasks, desc="Generating QAs")
-        for items in results:
-            all_qas.extend(items)
+        for coro in asyncio.as_completed(tasks):
+            await coro
+            pbar.update(1)
     except KeyboardInterrupt:
-        print("\n\n⚠️  Interrupted by user. Saving progress...")
+        print("\n\n⚠️  Interrupted by user. Progress already saved.")
+    finally:
+        pbar.close()
+        if out_file is not None:
+            out_file.close()
+        # Close the provider's pooled HTTP session while the loop is still
+        # alive; otherwise aiohttp reports unclosed sessions at GC time
+        if hasattr(provider, "aclose"):
+            await provider.aclose()
 
     if errors:
         print(f"\n⚠️  {len(errors)} chunks failed to process")
 
-    return all_qas
+    return qa_count
 
 
 def run_pipeline(
@@ -256,21 +324,18 @@ def run_pipeline(
     llm_provider = get_provider(provider=provider, model=model)
     print(f"Using LLM: {llm_provider.provider_name} ({llm_provider.model})")
 
-    # Auto-reduce concurrency for local models (they share the same GPU/CPU)
-    if llm_provider.provider_name == "ollama" and concurrency > 2:
-        concurrency = 2
-        print(f"💡 Auto-reduced concurrency to {concurrency} for local Ollama (shared GPU/CPU)")
-
     if audience or purpose:
         if audience:
             print(f"🎯 Target audience: {audience}")
         if purpose:
             print(f"📋 Document purpose: {purpose}")
 
-    # Use async generation for speed
-    all_qas = asyncio.run(
+    # Use async generation for speed; QAs stream straight to the output file
+    save_path = Path(output_path) if output_path else config.GENERATED_QAS_PATH
+    qa_count = asyncio.run(
         _async_generate_qas(
             valid_chunks,
+            save_path,
             concurrency=concurrency,
             provider=llm_provider,
             audience=audience,
@@ -278,19 +343,11 @@ def run_pipeline(
         )
     )
 
-    # --- 3. Save Results ---
-    if not all_qas:
+    # --- 3. Results ---
+    if not qa_count:
         print("\nNo QA pairs were generated.")
         return
 
-    save_path = Path(output_path) if output_path else config.GENERATED_QAS_PATH
-    save_path.parent.mkdir(parents=True, exist_ok=True)
-
-    print(f"\n--- Saving {len(all_qas)} Generated QAs ---")
-    with open(save_path, "w", encoding="utf-8") as f:
-        for qa in all_qas:
-            f.write(json.dumps(qa, ensure_ascii=False) + "\n")
-
-    print(f"✅ Pipeline complete! Results saved to {save_path}")
+    print(f"\n✅ Pipeline complete! {qa_count} QAs saved to {save_path}")
     print("\n⭐ Enjoying RAGScore? Star us: https://github.com/HZYAI/RagScore")
     print("💬 Questions? Join discussions: https://github.com/HZYAI/RagScore/discussions")
@@ -4,10 +4,23 @@ Base LLM Provider Interface
 Defines the abstract interface that all LLM providers must implement.
 """
 
+import asyncio
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, Optional
 
+# Shared by every provider's thread-offloading agenerate fallback. One
+# process-wide pool means threads are reused across calls and across event
+# loops (each asyncio.run would otherwise spin up and tear down its own
+# default executor, e.g. in notebooks).
+_LLM_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("RAGSCORE_LLM_THREADS", "16")),
+    thread_name_prefix="ragscore-llm",
+)
+
 
 @dataclass
 class LLMResponse:
@@ -97,9 +110,6 @@ class BaseLLMProvider(ABC):
         Returns:
             LLMResponse with generated content
         """
-        import asyncio
-        from functools import partial
-
         loop = asyncio.get_running_loop()
         func = partial(
             self.generate,
@@ -108,7 +118,7 @@ class BaseLLMProvider(ABC):
             json_mode=json_mode,
             **kwargs,
         )
-        return await loop.run_in_executor(None, func)
+        return await loop.run_in_executor(_LLM_EXECUTOR, func)
 
     def embed(self, texts: list[str], **kwargs) -> list[list[float]]:
         """
@@ -5,18 +5,38 @@ Supports local LLM inference via Ollama.
 https://ollama.ai/
 """
 
+import asyncio
+import json
 import logging
 import os
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+import aiohttp
 import requests
 
 from ..exceptions import LLMConnectionError, LLMError
 from .base import BaseLLMProvider, LLMResponse
 
+# orjson is optional but parses large chat responses several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(payload: bytes) -> dict:
+    """Parse a JSON response body, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
 class OllamaProvider(BaseLLMProvider):
     """
     LLM Provider for Ollama (local LLM inference).
@@ -40,6 +60,7 @@ class OllamaProvider(BaseLLMProvider):
     PROVIDER_NAME = "ollama"
     DEFAULT_MODEL = "llama3.1"
     DEFAULT_BASE_URL = "http://localhost:11434"
+    MAX_RETRIES = 3  # For transient errors (timeouts, 429/5xx, connection resets)
 
     # Preferred models in order (pick first available)
     _PREFERRED_MODELS = [
@@ -56,6 +77,14 @@ class OllamaProvider(BaseLLMProvider):
         "llama2",
     ]
 
+    # Compiled once from _PREFERRED_MODELS. Alternatives are tried in
+    # preference order, so the match group is the best-ranked preferred name
+    # that equals the model or prefixes it at a ':' tag boundary.
+    _PREFERRED_RE = re.compile(
+        "^(" + "|".join(re.escape(m) for m in _PREFERRED_MODELS) + ")(?::|$)"
+    )
+    _PREFERRED_RANK = {name: rank for rank, name in enumerate(_PREFERRED_MODELS)}
+
     def __init__(
         self,
         model: str = None,
@@ -76,6 +105,20 @@ class OllamaProvider(BaseLLMProvider):
         self.timeout = timeout
         self._server_checked = False
 
+        # Provider-intrinsic concurrency cap: local models share one GPU/CPU,
+        # so callers can request any concurrency and we self-throttle here.
+        self._max_concurrent = int(os.getenv("OLLAMA_MAX_CONCURRENT", "2"))
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._sem_loop = None
+
+        # Keep-alive pools: one requests.Session shared by all sync calls
+        # (thread-safe for the embedding worker threads) and one lazily built
+        # aiohttp session for agenerate, so repeat calls reuse connections
+        # instead of re-handshaking per request.
+        self._http = requests.Session()
+        self._asession: Optional[aiohttp.ClientSession] = None
+        self._asession_loop = None
+
         # Resolve model: explicit > env var > auto-detect > fallback
         self.model = model or os.getenv("OLLAMA_MODEL") or self._auto_detect_model()
 
@@ -92,7 +135,7 @@ class OllamaProvider(BaseLLMProvider):
     def _check_server(self) -> bool:
         """Check if Ollama server is running."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self._http.get(f"{self.base_url}/api/tags", timeout=5)
             return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
@@ -104,12 +147,21 @@ class OllamaProvider(BaseLLMProvider):
             if not available:
                 return self.DEFAULT_MODEL
 
-            # Match preferred models (prefix match to handle tags like llama3:8b)
-            for preferred in self._PREFERRED_MODELS:
-                for avail in available:
-                    if avail == preferred or avail.startswith(preferred + ":"):
-                        logger.info(f"Auto-selected Ollama model: {avail}")
-                        return avail
+            # One C-level regex scan per available model instead of the
+            # preferred×available nested startswith comparisons.
+            best_rank = len(self._PREFERRED_MODELS)
+            best_model = None
+            for avail in available:
+                m = self._PREFERRED_RE.match(avail)
+                if m:
+                    rank = self._PREFERRED_RANK[m.group(1)]
+                    if rank < best_rank:
+                        best_rank = rank
+                        best_model = avail
+
+            if best_model is not None:
+                logger.info(f"Auto-selected Ollama model: {best_model}")
+                return best_model
 
             # No preferred match — use first available
             logger.info(f"Using first available Ollama model: {available[0]}")
@@ -144,59 +196,218 @@ class OllamaProvider(BaseLLMProvider):
 
         temp = temperature if temperature is not None else 0.7
 
-        try:
-            request_json = {
-                "model": self.model,
-                "messages": messages,
-                "stream": False,
-                "options": {
-                    "temperature": temp,
-                    "num_predict": max_tokens,
-                },
-            }
-
-            # Add JSON format hint if requested
-            if json_mode:
-                request_json["format"] = "json"
-
-            response = requests.post(
-                f"{self.base_url}/api/chat",
-                json=request_json,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
+        request_json = {
+            "model": self.model,
+            "messages": messages,
+            "stream": False,
+            "options": {
+                "temperature": temp,
+                "num_predict": max_tokens,
+            },
+        }
+
+        # Add JSON format hint if requested
+        if json_mode:
+            request_json["format"] = "json"
+
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                response = self._http.post(
+                    f"{self.base_url}/api/chat",
+                    json=request_json,
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
 
-            data = response.json()
-            message = data.get("message", {})
-
-            return LLMResponse(
-                content=message.get("content", ""),
-                model=self.model,
-                usage={
-                    "prompt_tokens": data.get("prompt_eval_count", 0),
-                    "completion_tokens": data.get("eval_count", 0),
-                    "total_tokens": data.get("prompt_eval_count", 0) + data.get("eval_count", 0),
-                },
-                raw_response=data,
-            )
+                data = _json_loads(response.content)
+                message = data.get("message", {})
+                prompt_tokens = data.get("prompt_eval_count", 0)
+                completion_tokens = data.get("eval_count", 0)
+
+                return LLMResponse(
+                    content=message.get("content", ""),
+                    model=self.model,
+                    usage={
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": completion_tokens,
+                        "total_tokens": prompt_tokens + completion_tokens,
+                    },
+                    raw_response=data,
+                )
 
-        except requests.exceptions.Timeout as e:
-            raise LLMError(
-                f"Ollama request timed out after {self.timeout}s. "
-                "Try a smaller model or increase timeout."
-            ) from e
-        except requests.exceptions.HTTPError as e:
-            if e.response is not None and e.response.status_code == 404:
-                available = self.list_models()
-                models_str = ", ".join(available[:10]) if available else "none found"
+            except requests.exceptions.Timeout as e:
+                if self._backoff(attempt, f"request timed out after {self.timeout}s"):
+                    continue
                 raise LLMError(
-                    f"Model '{self.model}' not found in Ollama. "
-                    f"Available models: [{models_str}]. "
-                    f"Pull it with: ollama pull {self.model}"
+                    f"Ollama request timed out after {self.timeout}s. "
+                    "Try a smaller model or increase timeout."
                 ) from e
-            raise LLMConnectionError(f"Ollama HTTP error: {e}") from e
-        except requests.exceptions.RequestException as e:
-            raise LLMConnectionError(f"Failed to connect to Ollama: {e}") from e
+            except requests.exceptions.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status == 404:
+                    # Model missing — retrying won't help, keep this path intact
+                    available = self.list_models()
+                    models_str = ", ".join(available[:10]) if available else "none found"
+                    raise LLMError(
+                        f"Model '{self.model}' not found in Ollama. "
+                        f"Available models: [{models_str}]. "
+                        f"Pull it with: ollama pull {self.model}"
+                    ) from e
+                if status == 429 or (status is not None and status >= 500):
+                    if self._backoff(attempt, f"HTTP {status}"):
+                        continue
+                raise LLMConnectionError(f"Ollama HTTP error: {e}") from e
+            except requests.exceptions.RequestException as e:
+                if self._backoff(attempt, f"connection error: {e}"):
+                    continue
+                raise LLMConnectionError(f"Failed to connect to Ollama: {e}") from e
+
+        # Unreachable: the loop either returns or raises
+        raise LLMConnectionError("Ollama request failed after retries")
+
+    def _backoff(self, attempt: int, reason: str) -> bool:
+        """Sleep with exponential backoff + jitter. Returns False when retries are exhausted."""
+        if attempt >= self.MAX_RETRIES - 1:
+            return False
+        wait = (2**attempt) + random.uniform(0, 0.5)
+        logger.warning(
+            f"Ollama {reason} — retrying in {wait:.1f}s "
+            f"(attempt {attempt + 1}/{self.MAX_RETRIES})"
+        )
+        time.sleep(wait)
+        return True
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the per-provider semaphore, rebuilt if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._sem_loop is not loop:
+            self._sem = asyncio.Semaphore(self._max_concurrent)
+            self._sem_loop = loop
+        return self._sem
+
+    def _get_asession(self) -> aiohttp.ClientSession:
+        """Get the shared aiohttp session, rebuilt if the event loop changed.
+
+        A session that belonged to a previous (now finished) loop cannot be
+        awaited closed from here; it is simply dropped and its sockets are
+        reclaimed by the OS.
+        """
+        loop = asyncio.get_running_loop()
+        if self._asession is None or self._asession.closed or self._asession_loop is not loop:
+            self._asession = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=self._max_concurrent * 2,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                ),
+            )
+            self._asession_loop = loop
+        return self._asession
+
+    async def aclose(self) -> None:
+        """Close the pooled aiohttp session, if one was created."""
+        if self._asession is not None and not self._asession.closed:
+            await self._asession.close()
+
+    async def agenerate(
+        self,
+        messages: list[dict[str, str]],
+        temperature: Optional[float] = None,
+        json_mode: bool = False,
+        max_tokens: int = 1024,
+        **kwargs,
+    ) -> LLMResponse:
+        """
+        Async-native generation using aiohttp.
+
+        Throttled by a provider-level semaphore (OLLAMA_MAX_CONCURRENT,
+        default 2), so callers can use any concurrency without overloading
+        the local server.
+        """
+        if not self._server_checked:
+            if not await asyncio.to_thread(self._check_server):
+                raise LLMConnectionError("Ollama server not running. Start it with: ollama serve")
+            self._server_checked = True
+
+        temp = temperature if temperature is not None else 0.7
+
+        request_json = {
+            "model": self.model,
+            "messages": messages,
+            "stream": False,
+            "options": {
+                "temperature": temp,
+                "num_predict": max_tokens,
+            },
+        }
+        if json_mode:
+            request_json["format"] = "json"
+
+        async with self._get_semaphore():
+            session = self._get_asession()
+            for attempt in range(self.MAX_RETRIES):
+                try:
+                    async with session.post(
+                        f"{self.base_url}/api/chat", json=request_json
+                    ) as response:
+                        if response.status == 404:
+                            available = await asyncio.to_thread(self.list_models)
+                            models_str = ", ".join(available[:10]) if available else "none found"
+                            raise LLMError(
+                                f"Model '{self.model}' not found in Ollama. "
+                                f"Available models: [{models_str}]. "
+                                f"Pull it with: ollama pull {self.model}"
+                            )
+                        response.raise_for_status()
+                        data = _json_loads(await response.read())
+
+                    message = data.get("message", {})
+                    prompt_tokens = data.get("prompt_eval_count", 0)
+                    completion_tokens = data.get("eval_count", 0)
+
+                    return LLMResponse(
+                        content=message.get("content", ""),
+                        model=self.model,
+                        usage={
+                            "prompt_tokens": prompt_tokens,
+                            "completion_tokens": completion_tokens,
+                            "total_tokens": prompt_tokens + completion_tokens,
+                        },
+                        raw_response=data,
+                    )
+
+                except asyncio.TimeoutError as e:
+                    if await self._abackoff(attempt, f"request timed out after {self.timeout}s"):
+                        continue
+                    raise LLMError(
+                        f"Ollama request timed out after {self.timeout}s. "
+                        "Try a smaller model or increase timeout."
+                    ) from e
+                except aiohttp.ClientResponseError as e:
+                    if e.status == 429 or e.status >= 500:
+                        if await self._abackoff(attempt, f"HTTP {e.status}"):
+                            continue
+                    raise LLMConnectionError(f"Ollama HTTP error: {e}") from e
+                except aiohttp.ClientError as e:
+                    if await self._abackoff(attempt, f"connection error: {e}"):
+                        continue
+                    raise LLMConnectionError(f"Failed to connect to Ollama: {e}") from e
+
+        # Unreachable: the loop either returns or raises
+        raise LLMConnectionError("Ollama request failed after retries")
+
+    async def _abackoff(self, attempt: int, reason: str) -> bool:
+        """Async variant of _backoff using asyncio.sleep."""
+        if attempt >= self.MAX_RETRIES - 1:
+            return False
+        wait = (2**attempt) + random.uniform(0, 0.5)
+        logger.warning(
+            f"Ollama {reason} — retrying in {wait:.1f}s "
+            f"(attempt {attempt + 1}/{self.MAX_RETRIES})"
+        )
+        await asyncio.sleep(wait)
+        return True
 
     def get_embeddings(self, texts: list[str], model: Optional[str] = None) -> list[list[float]]:
         """
@@ -213,32 +424,35 @@ class OllamaProvider(BaseLLMProvider):
             raise LLMConnectionError("Ollama server not running")
 
         embed_model = model or self.model
-        embeddings = []
 
-        for text in texts:
+        def _embed_one(text: str) -> list[float]:
             try:
-                response = requests.post(
+                response = self._http.post(
                     f"{self.base_url}/api/embeddings",
                     json={"model": embed_model, "prompt": text},
                     timeout=self.timeout,
                 )
                 response.raise_for_status()
 
-                data = response.json()
-                embeddings.append(data.get("embedding", []))
+                return _json_loads(response.content).get("embedding", [])
 
             except requests.exceptions.RequestException as e:
                 raise LLMError(f"Ollama failed to get embeddings: {e}") from e
 
-        return embeddings
+        if len(texts) <= 1:
+            return [_embed_one(text) for text in texts]
+
+        # Overlap requests, but honour the same server throttle agenerate uses
+        with ThreadPoolExecutor(max_workers=min(self._max_concurrent, len(texts))) as pool:
+            return list(pool.map(_embed_one, texts))
 
     def list_models(self) -> list[str]:
         """List available models in Ollama."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=10)
+            response = self._http.get(f"{self.base_url}/api/tags", timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            data = _json_loads(response.content)
             return [model["name"] for model in data.get("models", [])]
 
         except requests.exceptions.RequestException:
@@ -21,17 +21,31 @@ Usage:
 """
 
 import asyncio
+import hashlib
 import json
+import os
 import random
+import sqlite3
 import sys
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Optional, Union
 
+import aiohttp
+
 from .data_processing import chunk_text, initialize_nltk, is_chunk_long_enough
 from .exceptions import RAGScoreError
-from .llm import agenerate_qa_for_chunk, detect_language, safe_json_parse
-from .ui import get_async_pbar, patch_asyncio
+from .llm import agenerate_qa_batch, detect_language, safe_json_parse
+from .ui import get_pbar, patch_asyncio
+
+# orjson is optional; judges that return clean JSON skip the slower
+# fence-stripping fallback in safe_json_parse entirely
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 _DETAILED_METRICS = [
     "correctness",
@@ -41,6 +55,180 @@ _DETAILED_METRICS = [
     "faithfulness",
 ]
 
+# Judge prompts are submitted in slices of this size, amortizing HTTP and
+# server-side batching cost instead of one serialized round trip per chunk.
+_JUDGE_BATCH_SIZE = 16
+
+# QA generation is micro-batched the same way (generation prompts are much
+# larger than judge prompts, so the batches are smaller)
+_GEN_BATCH_SIZE = 8
+
+# Shared by every judge call; providers only read messages, so one dict
+# instance can back all of them instead of being rebuilt per call
+_JUDGE_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are an impartial judge. Output only valid JSON.",
+}
+
+
+def _fast_lang(text: str) -> str:
+    """Pick the judge prompt language by scanning only the first 64 chars.
+
+    Short-circuits only when the head is CJK-dominant by the same ratios
+    detect_language applies to the whole string, so English text quoting
+    the odd CJK term still gets the full pass (which German vs English
+    needs anyway for its word-level markers).
+    """
+    head = text[:64]
+    total = kana = han = 0
+    for ch in head:
+        if ch.strip():
+            total += 1
+        if "\u3040" <= ch <= "\u30ff":
+            kana += 1
+        elif "\u4e00" <= ch <= "\u9fff":
+            han += 1
+    if total:
+        if kana > 0 and (kana + han) / total > 0.15:
+            return "ja"
+        if han / total > 0.3:
+            return "zh"
+    return detect_language(text)
+
+
+def _metric_averages(details: list[dict]) -> tuple[list, list]:
+    """Per-metric (averages, counts) over the detailed metrics in one pass.
+
+    Shared by plot() and the printed summary so each consumer scans the
+    row dicts once instead of once per metric. Averages are 0 where a
+    metric has no values; the count disambiguates.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None:
+        matrix = np.array(
+            [
+                [d.get(m) if d.get(m) is not None else np.nan for m in _DETAILED_METRICS]
+                for d in details
+            ],
+            dtype=np.float64,
+        )
+        valid = ~np.isnan(matrix)
+        counts = valid.sum(axis=0)
+        sums = np.where(valid, matrix, 0.0).sum(axis=0)
+        avgs = np.divide(sums, counts, out=np.zeros(len(_DETAILED_METRICS)), where=counts > 0)
+        return avgs.tolist(), counts.tolist()
+
+    sums = [0.0] * len(_DETAILED_METRICS)
+    counts = [0] * len(_DETAILED_METRICS)
+    for d in details:
+        for i, m in enumerate(_DETAILED_METRICS):
+            val = d.get(m)
+            if val is not None:
+                sums[i] += val
+                counts[i] += 1
+    return [s / c if c else 0.0 for s, c in zip(sums, counts)], counts
+
+
+# Lookup table mapping raw judge scores (shifted by +6) into 1..5: one
+# index replaces the max/min/int call chain on every score and metric
+_CLAMP_TABLE = tuple([1] * 7 + [1, 2, 3, 4, 5] + [5] * 20)
+
+
+def _clamp_score(value, default=None):
+    """Clamp a judge score to 1..5 via table lookup; default for junk values."""
+    try:
+        idx = int(value) + 6
+    except (TypeError, ValueError):
+        return default
+    if idx < 0:
+        return 1
+    if idx >= len(_CLAMP_TABLE):
+        return 5
+    return _CLAMP_TABLE[idx]
+
+
+class _JudgeCache:
+    """On-disk cache of judge verdicts keyed by (question, golden, rag, judge model) hash.
+
+    Re-running quick_test on unchanged answers (typical when iterating on a
+    RAG system or in CI) hits the cache and skips the judge LLM entirely.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        path = Path(path) if path is not None else Path.home() / ".ragscore" / "judge_cache.db"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS judge_cache (key BLOB PRIMARY KEY, value BLOB)"
+        )
+
+    @staticmethod
+    def key(
+        question: str, golden_answer: str, rag_answer: str, detailed: bool, model: str
+    ) -> bytes:
+        # detailed verdicts carry extra metric fields and different judge
+        # models score differently, so neither may share cache entries
+        raw = f"{question}\0{golden_answer}\0{rag_answer}\0{int(detailed)}\0{model}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[dict]:
+        row = self._conn.execute("SELECT value FROM judge_cache WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: bytes, verdict: dict) -> None:
+        self._conn.execute(
+            "INSERT INTO judge_cache (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, json.dumps(verdict, ensure_ascii=False)),
+        )
+
+    def close(self) -> None:
+        self._conn.commit()
+        self._conn.close()
+
+
+async def _judge_batch(
+    message_lists: list,
+    judge_provider,
+    batch_size: int = _JUDGE_BATCH_SIZE,
+    timeout: Optional[float] = None,
+):
+    """Submit judge prompts in bounded concurrent batches.
+
+    Returns one LLMResponse (or Exception) per message list, in order.
+    With a timeout, calls exceeding it yield asyncio.TimeoutError so one
+    stuck judge cannot stall the whole batch.
+    """
+    responses = []
+    for i in range(0, len(message_lists), batch_size):
+        batch = message_lists[i : i + batch_size]
+        coros = [
+            judge_provider.agenerate(messages=m, temperature=0.3, json_mode=True) for m in batch
+        ]
+        if timeout is not None:
+            coros = [asyncio.wait_for(c, timeout) for c in coros]
+        responses.extend(await asyncio.gather(*coros, return_exceptions=True))
+    return responses
+
+
+async def _aclose_providers(*providers) -> None:
+    """Close pooled HTTP sessions on providers that expose aclose().
+
+    Must run while the event loop is still alive — aiohttp reports any
+    session left open at GC time as an error on stderr.
+    """
+    closed = []
+    for p in providers:
+        if p is not None and hasattr(p, "aclose") and not any(p is c for c in closed):
+            closed.append(p)
+            await p.aclose()
+
 
 @dataclass
 class QuickTestResult:
@@ -71,6 +259,7 @@ class QuickTestResult:
     threshold: float = 0.7
     details: list[dict] = field(default_factory=list)
     corrections: list[dict] = field(default_factory=list)
+    _df_cache: Optional[object] = field(default=None, repr=False, compare=False)
 
     def __repr__(self) -> str:
         status = "✅ PASSED" if self.passed else "❌ FAILED"
@@ -82,16 +271,38 @@ class QuickTestResult:
         Results as a pandas DataFrame.
 
         Columns: question, golden_answer, rag_answer, score, reason, is_correct, source
+        (plus one column per metric when detailed=True).
+
+        Built column-wise with compact dtypes and cached after first access.
         """
+        if self._df_cache is not None:
+            return self._df_cache
+
         try:
             import pandas as pd
-
-            return pd.DataFrame(self.details)
         except ImportError as e:
             raise ImportError(
                 "pandas is required for .df property. Install with: pip install pandas"
             ) from e
 
+        if not self.details:
+            self._df_cache = pd.DataFrame(self.details)
+            return self._df_cache
+
+        # Column-oriented construction avoids pandas inferring dtypes from
+        # a list of per-row dicts; scores fit comfortably in int8.
+        columns = {key: [d.get(key) for d in self.details] for key in self.details[0].keys()}
+        df = pd.DataFrame(columns)
+        df["score"] = df["score"].astype("int8")
+        df["is_correct"] = df["is_correct"].astype(bool)
+        # Detailed metrics are 1-5 integers or None; float32 halves the bytes
+        # scanned by downstream reductions versus inferred float64/object.
+        for metric in _DETAILED_METRICS:
+            if metric in df.columns:
+                df[metric] = df[metric].astype("float32")
+        self._df_cache = df
+        return df
+
     def plot(self, figsize: tuple = None):
         """
         Generate a visualization of the test results.
@@ -109,12 +320,27 @@ class QuickTestResult:
             print("⚠️ Plotting requires matplotlib. Install with: pip install matplotlib")
             return
 
+        # Cheaper path rendering for large result sets; scoped via rc_context
+        # so the caller's global matplotlib settings are left untouched
+        rc_tuning = {
+            "path.simplify": True,
+            "path.simplify_threshold": 1.0,
+            "agg.path.chunksize": 10000,
+        }
+
         # Check if detailed metrics are available
         has_detailed = self.details and any(d.get("correctness") is not None for d in self.details)
         n_panels = 4 if has_detailed else 3
         if figsize is None:
             figsize = (16, 4) if has_detailed else (12, 4)
 
+        with plt.rc_context(rc_tuning):
+            fig = self._draw_panels(plt, np, has_detailed, n_panels, figsize)
+
+        return fig
+
+    def _draw_panels(self, plt, np, has_detailed: bool, n_panels: int, figsize: tuple):
+        """Render the plot() panels. Split out so plot() can scope rc tweaks."""
         fig, axes = plt.subplots(1, n_panels, figsize=figsize)
 
         # Panel 1: Pass/Fail Pie Chart
@@ -132,14 +358,30 @@ class QuickTestResult:
 
         # Panel 2: Score Distribution
         if self.details:
-            scores = [d.get("score", 0) for d in self.details]
-            axes[1].hist(
-                scores,
-                bins=[0.5, 1.5, 2.5, 3.5, 4.5, 5.5],
-                edgecolor="black",
-                color="#2196F3",
-                rwidth=0.8,
+            scores = np.fromiter(
+                (d.get("score", 0) for d in self.details), dtype=np.int64, count=len(self.details)
             )
+            if len(scores) > 500:
+                # bincount + bar draws five patches instead of hist binning
+                # thousands of points
+                counts = np.bincount(np.clip(scores, 0, 5), minlength=6)[1:]
+                axes[1].bar(
+                    [1, 2, 3, 4, 5],
+                    counts,
+                    width=0.8,
+                    edgecolor="black",
+                    color="#2196F3",
+                    rasterized=True,
+                )
+            else:
+                axes[1].hist(
+                    scores,
+                    bins=[0.5, 1.5, 2.5, 3.5, 4.5, 5.5],
+                    edgecolor="black",
+                    color="#2196F3",
+                    rwidth=0.8,
+                    rasterized=True,
+                )
             axes[1].set_xlabel("Score")
             axes[1].set_ylabel("Count")
             axes[1].set_xticks([1, 2, 3, 4, 5])
@@ -151,10 +393,8 @@ class QuickTestResult:
             ax_radar = fig.add_subplot(1, n_panels, 3, polar=True)
             metrics = _DETAILED_METRICS
             labels = [m.replace("_", " ").title() for m in metrics]
-            avgs = []
-            for m in metrics:
-                vals = [d.get(m) for d in self.details if d.get(m) is not None]
-                avgs.append(sum(vals) / len(vals) if vals else 0)
+            # One nan-aware matrix pass instead of a Python loop per metric
+            avgs, _ = _metric_averages(self.details)
 
             # Radar chart
             angles = np.linspace(0, 2 * np.pi, len(metrics), endpoint=False).tolist()
@@ -164,7 +404,7 @@ class QuickTestResult:
             ax_radar.set_theta_offset(np.pi / 2)
             ax_radar.set_theta_direction(-1)
             ax_radar.plot(angles, avgs_plot, "o-", linewidth=2, color="#2196F3")
-            ax_radar.fill(angles, avgs_plot, alpha=0.25, color="#2196F3")
+            ax_radar.fill(angles, avgs_plot, alpha=0.25, color="#2196F3", rasterized=True)
             ax_radar.set_xticks(angles[:-1])
             ax_radar.set_xticklabels(labels, size=8)
             ax_radar.set_ylim(0, 5)
@@ -226,12 +466,77 @@ class QuickTestResult:
         return self.df
 
 
-def _read_docs_for_quicktest(docs: Union[str, list[str], Path]) -> list[dict]:
-    """Read documents from path(s) for quick test."""
-    import uuid
+def _extract_pdf_text(file_path: Union[str, Path]) -> str:
+    """Extract text from a PDF, preferring pypdfium2 (C-backed, much faster).
+
+    Falls back to pypdf (always installed) when pypdfium2 is not available.
+    """
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        pdfium = None
+
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(str(file_path))
+        try:
+            parts = []
+            for page in pdf:
+                textpage = page.get_textpage()
+                parts.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
+            return "".join(parts)
+        finally:
+            pdf.close()
 
     import pypdf
 
+    with open(file_path, "rb") as fh:
+        reader = pypdf.PdfReader(fh)
+        return "".join(page.extract_text() or "" for page in reader.pages)
+
+
+def _extract_one(file_path_str: str) -> tuple[str, str]:
+    """Extract text from one document; returns (path, text).
+
+    Module-level so it can be pickled into worker processes. Errors are
+    swallowed (empty text), matching the quick test's best-effort reading.
+    """
+    file_path = Path(file_path_str)
+    try:
+        if file_path.suffix.lower() == ".pdf":
+            return file_path_str, _extract_pdf_text(file_path)
+        with open(file_path, encoding="utf-8", errors="ignore") as fh:
+            return file_path_str, fh.read()
+    except Exception:
+        return file_path_str, ""
+
+
+def _iter_supported_files(root: Path, suffixes: tuple):
+    """Yield files under root with a supported suffix.
+
+    Walks with os.scandir so file type comes from the directory entry
+    itself — rglob("*") stats every file (including unsupported ones)
+    before the suffix filter ever runs.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.lower().endswith(suffixes):
+                            yield Path(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def _read_docs_for_quicktest(docs: Union[str, list[str], Path]) -> list[dict]:
+    """Read documents from path(s) for quick test."""
     if isinstance(docs, (str, Path)):
         docs = [str(docs)]
 
@@ -247,36 +552,41 @@ def _read_docs_for_quicktest(docs: Union[str, list[str], Path]) -> list[dict]:
             files_to_process.append(path)
         elif path.is_dir():
             supported = (".pdf", ".txt", ".md", ".html")
-            files_to_process.extend([p for p in path.rglob("*") if p.suffix.lower() in supported])
+            files_to_process.extend(_iter_supported_files(path, supported))
+
+    # PDFs are CPU-bound (parsing) -> process pool; everything else is
+    # IO-bound reads -> thread pool. Small batches skip the pool overhead.
+    pdf_files = [str(p) for p in files_to_process if p.suffix.lower() == ".pdf"]
+    text_files = [str(p) for p in files_to_process if p.suffix.lower() != ".pdf"]
 
-    for file_path in files_to_process:
-        text = ""
+    extracted: list[tuple[str, str]] = []
+    if len(pdf_files) > 2:
         try:
-            if file_path.suffix.lower() == ".pdf":
-                with open(file_path, "rb") as fh:
-                    reader = pypdf.PdfReader(fh)
-                    text = "".join(page.extract_text() or "" for page in reader.pages)
-            else:
-                with open(file_path, encoding="utf-8", errors="ignore") as fh:
-                    text = fh.read()
+            with ProcessPoolExecutor() as pool:
+                extracted.extend(pool.map(_extract_one, pdf_files, chunksize=4))
+        except (OSError, ValueError):
+            # Process pools are unavailable in some sandboxed environments
+            extracted.extend(_extract_one(p) for p in pdf_files)
+    else:
+        extracted.extend(_extract_one(p) for p in pdf_files)
 
-            if text.strip():
-                all_docs.append({"doc_id": str(uuid.uuid4()), "path": str(file_path), "text": text})
-        except Exception:
-            continue
+    if len(text_files) > 2:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            extracted.extend(pool.map(_extract_one, text_files))
+    else:
+        extracted.extend(_extract_one(p) for p in text_files)
 
-    return all_docs
+    for path_str, text in extracted:
+        if text.strip():
+            all_docs.append({"doc_id": str(uuid.uuid4()), "path": path_str, "text": text})
 
+    return all_docs
 
-def _build_judge_prompt(
-    question: str, golden_answer: str, rag_answer: str, lang: str, detailed: bool = False
-) -> str:
-    """Build the LLM-as-judge prompt."""
-    if detailed:
-        return _build_detailed_judge_prompt(question, golden_answer, rag_answer, lang)
 
-    if lang == "zh":
-        return f"""比较RAG系统的回答与标准答案。
+# Judge prompt templates, rendered with str.format at call time. Building
+# these once at import avoids re-assembling the static rubric text (the bulk
+# of the prompt) on every judge call.
+_JUDGE_PROMPT_ZH = """比较RAG系统的回答与标准答案。
 
 问题: {question}
 标准答案: {golden_answer}
@@ -290,8 +600,8 @@ RAG回答: {rag_answer}
 - 1: 完全错误或无关
 
 请输出JSON格式: {{"score": 分数, "reason": "简短解释"}}"""
-    elif lang == "ja":
-        return f"""RAGシステムの回答を標準回答と比較してください。
+
+_JUDGE_PROMPT_JA = """RAGシステムの回答を標準回答と比較してください。
 
 質問: {question}
 標準回答: {golden_answer}
@@ -305,8 +615,8 @@ RAG回答: {rag_answer}
 - 1: 完全に間違い、または無関係
 
 JSON形式で出力: {{"score": N, "reason": "簡潔な説明"}}"""
-    elif lang == "de":
-        return f"""Vergleichen Sie die RAG-Antwort mit der Referenzantwort.
+
+_JUDGE_PROMPT_DE = """Vergleichen Sie die RAG-Antwort mit der Referenzantwort.
 
 Frage: {question}
 Referenzantwort: {golden_answer}
@@ -320,8 +630,8 @@ Bewertung 1-5:
 - 1: Völlig falsch oder irrelevant
 
 JSON ausgeben: {{"score": N, "reason": "kurze Erklärung"}}"""
-    else:
-        return f"""Compare the RAG answer to the golden answer for this question.
+
+_JUDGE_PROMPT_EN = """Compare the RAG answer to the golden answer for this question.
 
 Question: {question}
 Golden Answer: {golden_answer}
@@ -336,13 +646,14 @@ Score 1-5:
 
 Output JSON: {{"score": N, "reason": "brief explanation"}}"""
 
+_JUDGE_PROMPTS = {
+    "zh": _JUDGE_PROMPT_ZH,
+    "ja": _JUDGE_PROMPT_JA,
+    "de": _JUDGE_PROMPT_DE,
+    "en": _JUDGE_PROMPT_EN,
+}
 
-def _build_detailed_judge_prompt(
-    question: str, golden_answer: str, rag_answer: str, lang: str
-) -> str:
-    """Build the detailed multi-metric LLM-as-judge prompt."""
-    if lang == "zh":
-        return f"""你是一个公正的评审，对RAG系统的回答进行多维度评估。
+_DETAILED_JUDGE_PROMPT_ZH = """你是一个公正的评审，对RAG系统的回答进行多维度评估。
 
 问题: {question}
 标准答案: {golden_answer}
@@ -367,8 +678,8 @@ RAG回答: {rag_answer}
 
 请输出JSON格式:
 {{"score": 综合分数, "reason": "简短解释", "correctness": 分数, "completeness": 分数, "relevance": 分数, "conciseness": 分数, "faithfulness": 分数}}"""
-    elif lang == "ja":
-        return f"""あなたはRAGシステムの回答を複数の観点から評価する公正な審査員です。
+
+_DETAILED_JUDGE_PROMPT_JA = """あなたはRAGシステムの回答を複数の観点から評価する公正な審査員です。
 
 質問: {question}
 標準回答: {golden_answer}
@@ -392,8 +703,8 @@ RAG回答: {rag_answer}
    5=完全に忠実 4=ほぼ忠実 3=一部に根拠のない主張 2=かなりの捏造 1=ほとんど捏造
 
 JSON形式で出力: {{"score": N, "reason": "簡潔な説明", "correctness": N, "completeness": N, "relevance": N, "conciseness": N, "faithfulness": N}}"""
-    elif lang == "de":
-        return f"""Sie sind ein unparteiischer Richter, der die Antwort eines RAG-Systems in mehreren Dimensionen bewertet.
+
+_DETAILED_JUDGE_PROMPT_DE = """Sie sind ein unparteiischer Richter, der die Antwort eines RAG-Systems in mehreren Dimensionen bewertet.
 
 Frage: {question}
 Referenzantwort: {golden_answer}
@@ -417,8 +728,8 @@ Bewerten Sie jede Dimension 1-5:
    5=Vollständig treu 4=Größtenteils treu 3=Einige unbelegte Behauptungen 2=Erhebliche Erfindungen 1=Größtenteils erfunden
 
 JSON ausgeben: {{"score": N, "reason": "kurze Erklärung", "correctness": N, "completeness": N, "relevance": N, "conciseness": N, "faithfulness": N}}"""
-    else:
-        return f"""You are an impartial judge evaluating a RAG system answer across multiple dimensions.
+
+_DETAILED_JUDGE_PROMPT_EN = """You are an impartial judge evaluating a RAG system answer across multiple dimensions.
 
 Question: {question}
 Golden Answer: {golden_answer}
@@ -443,6 +754,22 @@ Score each dimension 1-5:
 
 Output JSON: {{"score": N, "reason": "brief explanation", "correctness": N, "completeness": N, "relevance": N, "conciseness": N, "faithfulness": N}}"""
 
+_DETAILED_JUDGE_PROMPTS = {
+    "zh": _DETAILED_JUDGE_PROMPT_ZH,
+    "ja": _DETAILED_JUDGE_PROMPT_JA,
+    "de": _DETAILED_JUDGE_PROMPT_DE,
+    "en": _DETAILED_JUDGE_PROMPT_EN,
+}
+
+
+def _build_judge_prompt(
+    question: str, golden_answer: str, rag_answer: str, lang: str, detailed: bool = False
+) -> str:
+    """Render the LLM-as-judge prompt from the precomputed template."""
+    templates = _DETAILED_JUDGE_PROMPTS if detailed else _JUDGE_PROMPTS
+    template = templates.get(lang, templates["en"])
+    return template.format(question=question, golden_answer=golden_answer, rag_answer=rag_answer)
+
 
 def _load_golden_qas(path: Union[str, Path]) -> list[dict]:
     """Load golden QA pairs from a JSONL file for quick_test."""
@@ -472,9 +799,12 @@ def _save_golden_qas(qas: list[dict], path: Union[str, Path]) -> None:
     """Save generated QA pairs to a JSONL file for reuse."""
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
+    with open(path, "wb") as f:
         for qa in qas:
-            f.write(json.dumps(qa, ensure_ascii=False) + "\n")
+            if orjson is not None:
+                f.write(orjson.dumps(qa) + b"\n")
+            else:
+                f.write((json.dumps(qa, ensure_ascii=False) + "\n").encode("utf-8"))
 
 
 async def _quick_test_async(
@@ -491,9 +821,14 @@ async def _quick_test_async(
     purpose: str = None,
     golden: Union[str, Path] = None,
     save_golden: Union[str, Path] = None,
+    seed: Optional[int] = None,
+    judge_timeout: Optional[float] = None,
+    use_judge_cache: bool = True,
 ) -> QuickTestResult:
     """Async implementation of quick_test."""
-    import aiohttp
+    # One private RNG for all sampling: seedable for reproducible runs, and
+    # avoids the module-level random lock on the hot path
+    rng = random.Random(seed)
 
     # Get providers
     if golden is not None:
@@ -514,7 +849,6 @@ async def _quick_test_async(
         if judge_provider is None:
             judge_provider = provider
 
-    semaphore = asyncio.Semaphore(concurrency)
     results = []
     corrections = []
 
@@ -523,7 +857,7 @@ async def _quick_test_async(
         golden_qas = _load_golden_qas(golden)
         # Respect n limit
         if len(golden_qas) > n:
-            golden_qas = random.sample(golden_qas, n)
+            golden_qas = rng.sample(golden_qas, n)
         if not silent:
             print(f"📂 Loaded {len(golden_qas)} QA pairs from {golden}")
     else:
@@ -539,8 +873,15 @@ async def _quick_test_async(
         if not all_docs:
             raise RAGScoreError(f"No documents found in {docs}")
 
+        # Chunking the whole corpus is wasted work when only n questions are
+        # needed. Shuffle the docs, chunk them one at a time, and stop once a
+        # 3x oversample of valid chunks is collected (margin keeps the final
+        # chunk sample diverse even when some docs are short).
+        candidate_docs = rng.sample(all_docs, len(all_docs))
+        target_chunks = n * 3
+
         all_chunks = []
-        for doc in all_docs:
+        for doc in candidate_docs:
             chunks = chunk_text(doc["text"])
             for chunk_text_content in chunks:
                 if is_chunk_long_enough(chunk_text_content):
@@ -552,13 +893,50 @@ async def _quick_test_async(
                             "chunk_id": len(all_chunks),
                         }
                     )
+            if len(all_chunks) >= target_chunks:
+                break
 
         if not all_chunks:
             raise RAGScoreError("No valid chunks found (all too short)")
 
         # Sample chunks for quick test
-        sample_chunks = random.sample(all_chunks, min(n, len(all_chunks)))
-        golden_qas = None  # Will be populated during processing
+        sample_chunks = rng.sample(all_chunks, min(n, len(all_chunks)))
+
+        # Generate all QA pairs up front in micro-batches so the provider's
+        # connection pool stays saturated instead of one round trip per chunk
+        difficulties = rng.choices(["easy", "medium", "hard"], k=len(sample_chunks))
+        # The caller's concurrency cap applies to generation calls too
+        gen_batch = max(1, min(_GEN_BATCH_SIZE, concurrency))
+        qa_lists: list[list[dict]] = []
+        for i in range(0, len(sample_chunks), gen_batch):
+            qa_lists.extend(
+                await agenerate_qa_batch(
+                    [c["text"] for c in sample_chunks[i : i + gen_batch]],
+                    difficulties[i : i + gen_batch],
+                    n=1,
+                    provider=provider,
+                    audience=audience,
+                    purpose=purpose,
+                )
+            )
+
+        golden_qas = []
+        for chunk, difficulty, qas in zip(sample_chunks, difficulties, qa_lists):
+            if not qas:
+                continue
+            question = (qas[0].get("question") or "").strip()
+            answer = (qas[0].get("answer") or "").strip()
+            if not question or not answer:
+                continue
+            golden_qas.append(
+                {
+                    "question": question,
+                    "answer": answer,
+                    "source": chunk["path"],
+                    "doc_id": chunk["doc_id"],
+                    "difficulty": difficulty,
+                }
+            )
 
     # Determine if endpoint is a function or URL
     is_function = callable(endpoint)
@@ -579,36 +957,38 @@ async def _quick_test_async(
         else:
             try:
                 payload = {"question": question}
-                async with http_session.post(
-                    endpoint, json=payload, timeout=aiohttp.ClientTimeout(total=30)
-                ) as resp:
+                async with http_session.post(endpoint, json=payload) as resp:
                     data = await resp.json()
                     rag_answer = data.get("answer", data.get("response", data.get("text", "")))
                     return str(rag_answer) if rag_answer else ""
             except Exception as e:
                 return f"[ERROR: {e}]"
 
-    async def _judge(question: str, golden_answer: str, rag_answer: str) -> tuple[int, str, dict]:
-        """Judge a RAG answer against the golden answer."""
-        lang = detect_language(question)
+    def _judge_messages(question: str, golden_answer: str, rag_answer: str) -> list[dict]:
+        """Build the judge messages for one RAG answer."""
+        lang = _fast_lang(question)
         judge_prompt = _build_judge_prompt(
             question, golden_answer, rag_answer, lang, detailed=detailed
         )
 
-        messages = [
-            {
-                "role": "system",
-                "content": "You are an impartial judge. Output only valid JSON.",
-            },
-            {"role": "user", "content": judge_prompt},
-        ]
+        return [_JUDGE_SYSTEM_MSG, {"role": "user", "content": judge_prompt}]
 
+    def _parse_judge_response(judge_resp) -> tuple[int, str, dict]:
+        """Extract (score, reason, data) from a judge response or Exception."""
+        if isinstance(judge_resp, asyncio.TimeoutError):
+            return 1, "Judge timeout", {}
+        if isinstance(judge_resp, Exception):
+            return 1, f"Judge error: {judge_resp}", {}
         try:
-            judge_resp = await judge_provider.agenerate(
-                messages=messages, temperature=0.3, json_mode=True
-            )
-            data = safe_json_parse(judge_resp.content)
-            score = max(1, min(5, int(data.get("score", 1))))
+            data = None
+            if orjson is not None:
+                try:
+                    data = orjson.loads(judge_resp.content)
+                except orjson.JSONDecodeError:
+                    data = None
+            if not isinstance(data, dict):
+                data = safe_json_parse(judge_resp.content)
+            score = _clamp_score(data.get("score", 1), default=1)
             reason = data.get("reason", "No reason provided")
             return score, reason, data
         except Exception as e:
@@ -636,11 +1016,7 @@ async def _quick_test_async(
         }
         if detailed:
             for metric in _DETAILED_METRICS:
-                val = data.get(metric)
-                if val is not None:
-                    result[metric] = max(1, min(5, int(val)))
-                else:
-                    result[metric] = None
+                result[metric] = _clamp_score(data.get(metric))
         if not is_correct:
             corrections.append(
                 {
@@ -655,98 +1031,148 @@ async def _quick_test_async(
     async def process_golden_qa(
         qa: dict, http_session: Optional[aiohttp.ClientSession] = None
     ) -> Optional[dict]:
-        """Query RAG and judge using a pre-generated QA pair."""
-        async with semaphore:
-            try:
-                question = qa.get("question", "")
-                golden_answer = qa.get("answer", "")
-                source = qa.get("source", qa.get("doc_id", "golden"))
-                if not question or not golden_answer:
-                    return None
-
-                rag_answer = await _query_rag(question, http_session)
-                score, reason, data = await _judge(question, golden_answer, rag_answer)
-                return _build_result(
-                    question, golden_answer, rag_answer, score, reason, data, source
-                )
-            except Exception as e:
-                if not silent:
-                    print(f"Error processing QA: {e}", file=sys.stderr)
+        """Query RAG using a pre-generated QA pair (judging happens later)."""
+        try:
+            question = qa.get("question", "")
+            golden_answer = qa.get("answer", "")
+            source = qa.get("source", qa.get("doc_id", "golden"))
+            if not question or not golden_answer:
                 return None
 
-    async def process_chunk(
-        chunk: dict, http_session: Optional[aiohttp.ClientSession] = None
-    ) -> Optional[dict]:
-        """Generate QA, query RAG, and judge - all in one."""
-        async with semaphore:
+            rag_answer = await _query_rag(question, http_session)
+            return {
+                "question": question,
+                "golden_answer": golden_answer,
+                "rag_answer": rag_answer,
+                "source": source,
+            }
+        except Exception as e:
+            if not silent:
+                print(f"Error processing QA: {e}", file=sys.stderr)
+            return None
+
+    # === Phase 1: query the RAG endpoint for every QA pair ===
+    # Tune the connection pool to the test's concurrency: enough keep-alive
+    # connections to avoid TCP/TLS setup per request, with DNS caching so
+    # repeated posts to the same endpoint skip resolution.
+    connector = aiohttp.TCPConnector(
+        limit=concurrency * 2,
+        limit_per_host=concurrency * 2,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+    )
+    session_timeout = aiohttp.ClientTimeout(total=30, connect=5)
+    # A fixed pool of workers pulling from a queue keeps exactly
+    # `concurrency` items in flight without creating one task (plus
+    # semaphore bookkeeping) per test question up front.
+    work_queue: asyncio.Queue = asyncio.Queue()
+    for i, qa in enumerate(golden_qas):
+        work_queue.put_nowait((i, qa))
+
+    # Workers write into preallocated slots by index so the result order
+    # matches the (seedable) QA order regardless of completion order
+    slots: list[Optional[dict]] = [None] * len(golden_qas)
+    pbar = None if silent else get_pbar(total=len(golden_qas), desc="Quick Testing")
+
+    async def _worker(http_session: aiohttp.ClientSession) -> None:
+        while True:
             try:
-                # 1. Generate QA pair
-                difficulty = random.choice(["easy", "medium", "hard"])
-                qas = await agenerate_qa_for_chunk(
-                    chunk["text"],
-                    difficulty,
-                    n=1,
-                    provider=provider,
-                    audience=audience,
-                    purpose=purpose,
+                i, item = work_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            slots[i] = await process_golden_qa(item, http_session=http_session)
+            if pbar is not None:
+                pbar.update(1)
+
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=session_timeout
+    ) as shared_session:
+        n_workers = min(concurrency, len(golden_qas)) or 1
+        await asyncio.gather(*[_worker(shared_session) for _ in range(n_workers)])
+
+    if pbar is not None:
+        pbar.close()
+
+    answers = [a for a in slots if a is not None]
+
+    # === Phase 2: judge all answers in batches instead of one-by-one ===
+    if answers:
+        cache = None
+        if use_judge_cache:
+            try:
+                cache = _JudgeCache()
+            except (OSError, sqlite3.Error):
+                cache = None  # cache is best-effort; judge everything
+
+        verdicts: list[Optional[dict]] = [None] * len(answers)
+        keys = []
+        pending = []
+        for i, a in enumerate(answers):
+            key = None
+            if cache is not None:
+                key = _JudgeCache.key(
+                    a["question"],
+                    a["golden_answer"],
+                    a["rag_answer"],
+                    detailed,
+                    getattr(judge_provider, "model", ""),
                 )
-                if not qas:
-                    return None
-
-                qa = qas[0]
-                question = qa.get("question", "")
-                golden_answer = qa.get("answer", "")
-
-                if not question or not golden_answer:
-                    return None
-
-                # Store for save_golden
-                if save_golden is not None:
-                    generated_qas_list.append(
-                        {
-                            "question": question,
-                            "answer": golden_answer,
-                            "source": chunk["path"],
-                            "doc_id": chunk["doc_id"],
-                            "difficulty": difficulty,
-                        }
-                    )
-
-                rag_answer = await _query_rag(question, http_session)
-                score, reason, data = await _judge(question, golden_answer, rag_answer)
-                return _build_result(
-                    question, golden_answer, rag_answer, score, reason, data, chunk["path"]
+                verdicts[i] = cache.get(key)
+            keys.append(key)
+            if verdicts[i] is None:
+                pending.append(i)
+
+        if pending:
+            message_lists = [
+                _judge_messages(
+                    answers[i]["question"],
+                    answers[i]["golden_answer"],
+                    answers[i]["rag_answer"],
                 )
-
-            except Exception as e:
-                if not silent:
-                    print(f"Error processing chunk: {e}", file=sys.stderr)
-                return None
-
-    # Track generated QAs for save_golden
-    generated_qas_list = []
-
-    # Process with shared HTTP session
-    async with aiohttp.ClientSession() as shared_session:
-        if golden is not None:
-            tasks = [process_golden_qa(qa, http_session=shared_session) for qa in golden_qas]
-        else:
-            tasks = [process_chunk(chunk, http_session=shared_session) for chunk in sample_chunks]
-
-        if silent:
-            raw_results = await asyncio.gather(*tasks)
-        else:
-            async_pbar = get_async_pbar()
-            raw_results = await async_pbar.gather(*tasks, desc="Quick Testing")
-
-    # Filter out None results
-    results = [r for r in raw_results if r is not None]
+                for i in pending
+            ]
+            judge_responses = await _judge_batch(
+                message_lists,
+                judge_provider,
+                # The caller's concurrency cap applies to judge calls too
+                batch_size=max(1, min(_JUDGE_BATCH_SIZE, concurrency)),
+                timeout=judge_timeout,
+            )
+            for i, judge_resp in zip(pending, judge_responses):
+                score, reason, data = _parse_judge_response(judge_resp)
+                verdicts[i] = {"score": score, "reason": reason, "data": data}
+                # Only successful verdicts are persisted; errors and
+                # timeouts should be retried on the next run
+                if cache is not None and data:
+                    cache.put(keys[i], verdicts[i])
+
+        if cache is not None:
+            cache.close()
+
+        for answer, verdict in zip(answers, verdicts):
+            if verdict is None:
+                # Unreachable — phase 2 judges every slot the cache missed —
+                # but narrows the Optional for the type checker
+                continue
+            results.append(
+                _build_result(
+                    answer["question"],
+                    answer["golden_answer"],
+                    answer["rag_answer"],
+                    verdict["score"],
+                    verdict["reason"],
+                    verdict["data"],
+                    answer["source"],
+                )
+            )
 
     # Save generated QAs for reuse
-    if save_golden is not None and generated_qas_list:
-        _save_golden_qas(generated_qas_list, save_golden)
+    if save_golden is not None and golden is None and golden_qas:
+        _save_golden_qas(golden_qas, save_golden)
         if not silent:
-            print(f"💾 Saved {len(generated_qas_list)} QA pairs to {save_golden}")
+            print(f"💾 Saved {len(golden_qas)} QA pairs to {save_golden}")
+
+    await _aclose_providers(provider, judge_provider)
 
     if not results:
         return QuickTestResult(
@@ -793,6 +1219,9 @@ def quick_test(
     purpose: Optional[str] = None,
     golden: Optional[Union[str, Path]] = None,
     save_golden: Optional[Union[str, Path]] = None,
+    seed: Optional[int] = None,
+    judge_timeout: Optional[float] = None,
+    use_judge_cache: bool = True,
 ) -> QuickTestResult:
     """
     Quick RAG accuracy test - generate QAs and evaluate in one call.
@@ -819,6 +1248,14 @@ def quick_test(
                 and enables deterministic regression testing.
         save_golden: Path to save generated QA pairs (JSONL) for future reuse.
                      Only used when generating from docs (not with 'golden').
+        seed: Random seed for document/chunk sampling and difficulty mix.
+              Set for reproducible test selections (e.g. in CI).
+        judge_timeout: Max seconds per judge call. Calls that exceed it are
+                       scored 1 with reason "Judge timeout" instead of
+                       stalling the whole run (default: no timeout).
+        use_judge_cache: Cache judge verdicts on disk (~/.ragscore/) keyed by
+                         (question, golden, rag_answer). Re-runs on unchanged
+                         answers skip the judge LLM entirely (default: True).
 
     Returns:
         QuickTestResult - Rich Object with:
@@ -883,6 +1320,9 @@ def quick_test(
             purpose=purpose,
             golden=golden,
             save_golden=save_golden,
+            seed=seed,
+            judge_timeout=judge_timeout,
+            use_judge_cache=use_judge_cache,
         )
     )
 
@@ -897,10 +1337,9 @@ def quick_test(
         if detailed and result.details:
             separator = "─" * 50
             print(separator)
-            for metric in _DETAILED_METRICS:
-                vals = [d.get(metric) for d in result.details if d.get(metric) is not None]
-                if vals:
-                    avg = sum(vals) / len(vals)
+            avgs, counts = _metric_averages(result.details)
+            for metric, avg, count in zip(_DETAILED_METRICS, avgs, counts):
+                if count:
                     label = metric.replace("_", " ").title()
                     print(f"  {label}: {avg:.1f}/5.0")
 
@@ -919,6 +1358,7 @@ def quick_test(
 def export_corrections(
     result: QuickTestResult,
     output_path: Union[str, Path] = "corrections.jsonl",
+    append: bool = False,
 ) -> str:
     """
     Export corrections from a QuickTestResult to JSONL file.
@@ -928,6 +1368,8 @@ def export_corrections(
     Args:
         result: QuickTestResult from quick_test()
         output_path: Path to save corrections JSONL
+        append: Append to an existing file instead of overwriting (useful for
+                accumulating corrections across repeated runs)
 
     Returns:
         Path to the saved file
@@ -935,8 +1377,16 @@ def export_corrections(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        for correction in result.corrections:
-            f.write(json.dumps(correction, ensure_ascii=False) + "\n")
+    # Serialize everything into one buffer and write it in a single syscall
+    buf = bytearray()
+    for correction in result.corrections:
+        if orjson is not None:
+            buf += orjson.dumps(correction)
+        else:
+            buf += json.dumps(correction, ensure_ascii=False).encode("utf-8")
+        buf += b"\n"
+
+    with open(output_path, "ab" if append else "wb") as f:
+        f.write(buf)
 
     return str(output_path)
@@ -0,0 +1,87 @@
+"""Tests for the on-disk QA generation cache."""
+
+import pytest
+
+from ragscore import llm_cache
+
+
+@pytest.fixture
+def tmp_cache(tmp_path, monkeypatch):
+    """Point the cache at a temp file and reset the shared connection."""
+    monkeypatch.setattr(llm_cache, "_CACHE_PATH", tmp_path / "qa_cache.db")
+    monkeypatch.setattr(llm_cache, "_conn", None)
+    monkeypatch.delenv("RAGSCORE_NO_CACHE", raising=False)
+    yield
+    if llm_cache._conn is not None:
+        llm_cache._conn.close()
+        llm_cache._conn = None
+
+
+class TestQAKey:
+    """Test cache key construction."""
+
+    def test_key_is_stable(self):
+        """Test identical inputs hash to the same key."""
+        a = llm_cache.qa_key("chunk", "easy", 2, "model-a", None, None)
+        b = llm_cache.qa_key("chunk", "easy", 2, "model-a", None, None)
+        assert a == b
+
+    def test_key_depends_on_model_and_settings(self):
+        """Test changing any generation setting changes the key."""
+        base = llm_cache.qa_key("chunk", "easy", 2, "model-a", None, None)
+        assert llm_cache.qa_key("chunk", "easy", 2, "model-b", None, None) != base
+        assert llm_cache.qa_key("chunk", "hard", 2, "model-a", None, None) != base
+        assert llm_cache.qa_key("chunk", "easy", 3, "model-a", None, None) != base
+        assert llm_cache.qa_key("chunk", "easy", 2, "model-a", "devs", None) != base
+
+
+class TestLookupStore:
+    """Test cache hit/miss behaviour."""
+
+    def test_lookup_miss(self, tmp_cache):
+        """Test an unknown key returns None."""
+        key = llm_cache.qa_key("never stored", "easy", 2, "model", None, None)
+        assert llm_cache.lookup(key) is None
+
+    def test_store_then_lookup(self, tmp_cache):
+        """Test stored items round-trip."""
+        key = llm_cache.qa_key("chunk", "easy", 1, "model", None, None)
+        items = [{"question": "q", "answer": "a"}]
+
+        llm_cache.store(key, items)
+
+        assert llm_cache.lookup(key) == items
+
+    def test_disabled_via_env(self, tmp_cache, monkeypatch):
+        """Test RAGSCORE_NO_CACHE turns the cache off entirely."""
+        key = llm_cache.qa_key("chunk", "easy", 1, "model", None, None)
+        llm_cache.store(key, [{"question": "q", "answer": "a"}])
+
+        monkeypatch.setenv("RAGSCORE_NO_CACHE", "1")
+
+        assert llm_cache.cache_enabled() is False
+        assert llm_cache.lookup(key) is None
+
+
+class TestGenerateCacheHit:
+    """Test the cache fast path in generate_qa_for_chunk."""
+
+    def test_hit_skips_llm_and_issues_fresh_ids(self, tmp_cache):
+        """Test a cache hit returns the stored QAs with new ids, no LLM call."""
+        from ragscore import llm
+
+        class NoCallProvider:
+            model = "fake-model"
+
+            def generate(self, *args, **kwargs):
+                raise AssertionError("LLM must not be called on a cache hit")
+
+        key = llm_cache.qa_key("chunk text", "easy", 1, "fake-model", None, None)
+        llm_cache.store(key, [{"question": "q", "answer": "a"}])
+
+        first = llm.generate_qa_for_chunk("chunk text", "easy", n=1, provider=NoCallProvider())
+        second = llm.generate_qa_for_chunk("chunk text", "easy", n=1, provider=NoCallProvider())
+
+        assert first[0]["question"] == "q"
+        assert first[0]["answer"] == "a"
+        assert first[0]["id"] != second[0]["id"]
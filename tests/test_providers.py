@@ -216,6 +216,205 @@ class TestOpenAIProvider:
         assert response.model == "gpt-4o-mini"
 
 
+class TestOllamaProvider:
+    """Test Ollama provider retry classification (mocked HTTP)."""
+
+    def _provider(self):
+        from ragscore.providers.ollama_provider import OllamaProvider
+
+        provider = OllamaProvider(model="test-model")
+        provider._server_checked = True
+        return provider
+
+    @staticmethod
+    def _ok_response(payload: dict):
+        import json
+
+        resp = MagicMock()
+        resp.raise_for_status.return_value = None
+        resp.content = json.dumps(payload).encode("utf-8")
+        return resp
+
+    @staticmethod
+    def _error_response(status: int):
+        import requests
+
+        error_resp = MagicMock()
+        error_resp.status_code = status
+        resp = MagicMock()
+        resp.raise_for_status.side_effect = requests.exceptions.HTTPError(response=error_resp)
+        return resp
+
+    def test_generate_success(self):
+        """Test successful generation with token usage."""
+        provider = self._provider()
+        payload = {
+            "message": {"content": "Test response"},
+            "prompt_eval_count": 10,
+            "eval_count": 20,
+        }
+        provider._http.post = MagicMock(return_value=self._ok_response(payload))
+
+        response = provider.generate([{"role": "user", "content": "Hello"}])
+
+        assert response.content == "Test response"
+        assert response.usage["total_tokens"] == 30
+        assert provider._http.post.call_count == 1
+
+    def test_generate_404_not_retried(self):
+        """Test a missing model raises immediately without retrying."""
+        from ragscore.exceptions import LLMError
+
+        provider = self._provider()
+        provider._http.post = MagicMock(return_value=self._error_response(404))
+        provider.list_models = MagicMock(return_value=["llama3"])
+
+        with pytest.raises(LLMError, match="not found"):
+            provider.generate([{"role": "user", "content": "Hello"}])
+
+        assert provider._http.post.call_count == 1
+
+    def test_generate_server_error_retries_then_raises(self):
+        """Test 5xx responses are retried with backoff before raising."""
+        from ragscore.exceptions import LLMConnectionError
+        from ragscore.providers.ollama_provider import OllamaProvider
+
+        provider = self._provider()
+        provider._http.post = MagicMock(return_value=self._error_response(500))
+
+        with patch("ragscore.providers.ollama_provider.time.sleep") as mock_sleep:
+            with pytest.raises(LLMConnectionError):
+                provider.generate([{"role": "user", "content": "Hello"}])
+
+        assert provider._http.post.call_count == OllamaProvider.MAX_RETRIES
+        assert mock_sleep.call_count == OllamaProvider.MAX_RETRIES - 1
+
+    def test_generate_rate_limit_retry_then_success(self):
+        """Test a 429 is retried and the retry's response is returned."""
+        provider = self._provider()
+        payload = {"message": {"content": "Recovered"}, "prompt_eval_count": 1, "eval_count": 1}
+        provider._http.post = MagicMock(
+            side_effect=[self._error_response(429), self._ok_response(payload)]
+        )
+
+        with patch("ragscore.providers.ollama_provider.time.sleep"):
+            response = provider.generate([{"role": "user", "content": "Hello"}])
+
+        assert response.content == "Recovered"
+        assert provider._http.post.call_count == 2
+
+    def test_generate_timeout_exhausts_retries(self):
+        """Test timeouts are retried until exhausted, then raise LLMError."""
+        import requests
+
+        from ragscore.exceptions import LLMError
+        from ragscore.providers.ollama_provider import OllamaProvider
+
+        provider = self._provider()
+        provider._http.post = MagicMock(side_effect=requests.exceptions.Timeout())
+
+        with patch("ragscore.providers.ollama_provider.time.sleep"):
+            with pytest.raises(LLMError, match="timed out"):
+                provider.generate([{"role": "user", "content": "Hello"}])
+
+        assert provider._http.post.call_count == OllamaProvider.MAX_RETRIES
+
+
+class TestOllamaProviderAsync:
+    """Test Ollama async generation and per-loop session/semaphore handling."""
+
+    def _provider(self):
+        from ragscore.providers.ollama_provider import OllamaProvider
+
+        provider = OllamaProvider(model="test-model")
+        provider._server_checked = True
+        return provider
+
+    def test_agenerate_success(self):
+        """Test async generation against a stubbed pooled session."""
+        import asyncio
+        import json
+
+        provider = self._provider()
+        payload = {"message": {"content": "Async ok"}, "prompt_eval_count": 5, "eval_count": 7}
+
+        class StubResponse:
+            status = 200
+
+            def raise_for_status(self):
+                pass
+
+            async def read(self):
+                return json.dumps(payload).encode("utf-8")
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+        class StubSession:
+            def post(self, url, json=None):
+                return StubResponse()
+
+        provider._get_asession = lambda: StubSession()
+
+        response = asyncio.run(provider.agenerate([{"role": "user", "content": "Hello"}]))
+
+        assert response.content == "Async ok"
+        assert response.usage["total_tokens"] == 12
+
+    def test_semaphore_rebuilt_per_loop(self):
+        """Test the throttle semaphore is reused in-loop and rebuilt across loops."""
+        import asyncio
+
+        provider = self._provider()
+
+        async def get_two():
+            return provider._get_semaphore(), provider._get_semaphore()
+
+        first, second = asyncio.run(get_two())
+        assert first is second
+
+        third, _ = asyncio.run(get_two())
+        assert third is not first
+
+    def test_asession_reused_until_closed(self):
+        """Test the pooled session is shared in-loop and replaced after aclose()."""
+        import asyncio
+
+        provider = self._provider()
+
+        async def main():
+            first = provider._get_asession()
+            assert provider._get_asession() is first
+
+            await provider.aclose()
+            assert first.closed
+
+            second = provider._get_asession()
+            assert second is not first
+            assert not second.closed
+            await provider.aclose()
+
+        asyncio.run(main())
+
+    def test_asession_rebuilt_after_loop_change(self):
+        """Test a session bound to a finished loop is not reused."""
+        import asyncio
+
+        provider = self._provider()
+
+        async def use_and_close():
+            session = provider._get_asession()
+            await provider.aclose()
+            return session
+
+        first = asyncio.run(use_and_close())
+        second = asyncio.run(use_and_close())
+        assert first is not second
+
+
 class TestProviderIntegration:
     """Integration tests for providers."""
 